@@ -1,8 +1,11 @@
 # pylint doesn't know about pytest fixtures
 # pylint: disable=unused-argument
 
+import copy
+import functools
 import os
-import time
+import sys
+import threading
 
 from dagster_k8s.job import get_job_name_from_run_id
 from dagster_k8s.utils import delete_job
@@ -10,6 +13,7 @@
 from dagster_test.test_project import get_test_project_environments_path
 from marks import mark_monitoring
 
+from dagster.core.events import DagsterEventType
 from dagster.core.storage.pipeline_run import PipelineRunStatus
 from dagster.core.test_utils import poll_for_finished_run
 from dagster.utils import merge_dicts
@@ -17,51 +21,71 @@
 
 IS_BUILDKITE = os.getenv("BUILDKITE") is not None
 
+IMAGE_PULL_POLICY = image_pull_policy()
+ENV_YAML_PATHS = (
+    os.path.join(get_test_project_environments_path(), "env.yaml"),
+    os.path.join(get_test_project_environments_path(), "env_s3.yaml"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_base_env():
+    return merge_yamls(list(ENV_YAML_PATHS))
+
+
+def load_base_env():
+    # copy so that callers can't mutate the cached config
+    return copy.deepcopy(_load_base_env())
+
 
 def log_run_events(instance, run_id):
-    for log in instance.all_logs(run_id):
-        print(str(log) + "\n")  # pylint: disable=print-call
+    # write in one call instead of a print per event; entries stay separated by a blank line
+    sys.stdout.write("".join(str(log) + "\n\n" for log in instance.all_logs(run_id)))
+    sys.stdout.flush()
+
+
+def wait_for_run_start(instance, run_id, timeout=60):
+    """Block until the run emits its start event (or the timeout elapses), then return the run.
+
+    Subscribes to the run's event log rather than polling the run storage, so the wait ends as
+    soon as the STARTING -> STARTED transition is recorded.
+    """
+    started = threading.Event()
+
+    def _on_event(event, _cursor):
+        if event.dagster_event_type == DagsterEventType.RUN_START:
+            started.set()
+
+    instance.watch_event_logs(run_id, None, _on_event)
+    try:
+        # the run may have started before the watch was registered
+        if instance.get_run_by_id(run_id).status != PipelineRunStatus.STARTED:
+            started.wait(timeout=timeout)
+    finally:
+        instance.end_watch_event_logs(run_id, _on_event)
+
+    return instance.get_run_by_id(run_id)
 
 
 def get_celery_job_engine_config(dagster_docker_image, job_namespace):
-    return {
-        "execution": {
-            "config": merge_dicts(
-                (
-                    {
-                        "job_image": dagster_docker_image,
-                    }
-                    if dagster_docker_image
-                    else {}
-                ),
-                {
-                    "job_namespace": job_namespace,
-                    "image_pull_policy": image_pull_policy(),
-                },
-            )
-        },
+    config = {
+        "job_namespace": job_namespace,
+        "image_pull_policy": IMAGE_PULL_POLICY,
     }
+    if dagster_docker_image:
+        config["job_image"] = dagster_docker_image
+    return {"execution": {"config": config}}
 
 
 def get_failing_celery_job_engine_config(dagster_docker_image, job_namespace):
-    return {
-        "execution": {
-            "config": merge_dicts(
-                (
-                    {
-                        "job_image": dagster_docker_image,
-                    }
-                    if dagster_docker_image
-                    else {}
-                ),
-                {
-                    "job_namespace": job_namespace,
-                    "image_pull_policy": image_pull_policy(),
-                    "env_config_maps": ["non-existent-config-map"],
-                },
-            )
-        },
+    config = {
+        "job_namespace": job_namespace,
+        "image_pull_policy": IMAGE_PULL_POLICY,
+        "env_config_maps": ["non-existent-config-map"],
     }
+    if dagster_docker_image:
+        config["job_image"] = dagster_docker_image
+    return {"execution": {"config": config}}
 
 
 @mark_monitoring
@@ -69,12 +93,7 @@ def test_run_monitoring_fails_on_interrupt(  # pylint: disable=redefined-outer-n
     dagster_docker_image, dagster_instance, helm_namespace, dagit_url
 ):
     run_config = merge_dicts(
-        merge_yamls(
-            [
-                os.path.join(get_test_project_environments_path(), "env.yaml"),
-                os.path.join(get_test_project_environments_path(), "env_s3.yaml"),
-            ]
-        ),
+        load_base_env(),
         get_celery_job_engine_config(
             dagster_docker_image=dagster_docker_image, job_namespace=helm_namespace
         ),
@@ -86,13 +105,8 @@ def test_run_monitoring_fails_on_interrupt(  # pylint: disable=redefined-outer-n
         run_id = launch_run_over_graphql(
             dagit_url, run_config=run_config, pipeline_name=pipeline_name
         )
-        start_time = time.time()
-        while time.time() - start_time < 60:
-            run = dagster_instance.get_run_by_id(run_id)
-            if run.status == PipelineRunStatus.STARTED:
-                break
-            assert run.status == PipelineRunStatus.STARTING
-            time.sleep(1)
+        run = wait_for_run_start(dagster_instance, run_id, timeout=60)
+        assert run.status in (PipelineRunStatus.STARTED, PipelineRunStatus.STARTING)
 
         assert delete_job(get_job_name_from_run_id(run_id), helm_namespace)
         poll_for_finished_run(dagster_instance, run.run_id, timeout=120)
@@ -106,12 +120,7 @@ def test_run_monitoring_startup_fail(  # pylint: disable=redefined-outer-name
     dagster_docker_image, dagster_instance, helm_namespace, dagit_url
 ):
     run_config = merge_dicts(
-        merge_yamls(
-            [
-                os.path.join(get_test_project_environments_path(), "env.yaml"),
-                os.path.join(get_test_project_environments_path(), "env_s3.yaml"),
-            ]
-        ),
+        load_base_env(),
         get_failing_celery_job_engine_config(
             dagster_docker_image=dagster_docker_image, job_namespace=helm_namespace
         ),
@@ -123,13 +132,8 @@ def test_run_monitoring_startup_fail(  # pylint: disable=redefined-outer-name
         run_id = launch_run_over_graphql(
             dagit_url, run_config=run_config, pipeline_name=pipeline_name
         )
-        start_time = time.time()
-        while time.time() - start_time < 60:
-            run = dagster_instance.get_run_by_id(run_id)
-            if run.status == PipelineRunStatus.STARTED:
-                break
-            assert run.status == PipelineRunStatus.STARTING
-            time.sleep(1)
+        run = wait_for_run_start(dagster_instance, run_id, timeout=60)
+        assert run.status in (PipelineRunStatus.STARTED, PipelineRunStatus.STARTING)
 
         assert delete_job(get_job_name_from_run_id(run_id), helm_namespace)
         poll_for_finished_run(dagster_instance, run.run_id, timeout=120)
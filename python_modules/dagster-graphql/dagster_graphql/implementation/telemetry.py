@@ -1,15 +1,52 @@
 import json
-from datetime import datetime
+import weakref
+from datetime import datetime, timedelta
 
 from dagster.core.telemetry import log_action
 
+try:
+    # orjson is an optional, faster parser for the telemetry metadata payload
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    # orjson rejects NaN/Infinity and integers wider than 64 bits, which the stdlib parser accepts
+    if orjson is not None:
+        try:
+            return orjson.loads(data)  # pylint: disable=no-member
+        except orjson.JSONDecodeError:  # pylint: disable=no-member
+            pass
+    return json.loads(data)
+
+
+# naive UTC epoch, matching the naive UTC datetimes produced by datetime.utcfromtimestamp
+_EPOCH = datetime(1970, 1, 1)
+
+# instance settings are fixed once the instance is loaded, so the telemetry setting is resolved
+# once per instance rather than on every telemetry mutation
+_TELEMETRY_ENABLED_BY_INSTANCE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _get_instance_dagit_telemetry_enabled(instance):
+    enabled = _TELEMETRY_ENABLED_BY_INSTANCE.get(instance)
+    if enabled is None:
+        enabled = bool(instance.telemetry_enabled)
+        _TELEMETRY_ENABLED_BY_INSTANCE[instance] = enabled
+    return enabled
+
 
 def log_dagit_telemetry_event(graphene_info, action, client_time, metadata):
     from ..schema.roots.mutation import GrapheneLogTelemetrySuccess
 
     instance = graphene_info.context.instance
-    metadata = json.loads(metadata)
-    client_time = datetime.utcfromtimestamp(int(client_time) / 1000)
+    if not _get_instance_dagit_telemetry_enabled(instance):
+        # log_action would drop the event anyway, so skip decoding the payload
+        return GrapheneLogTelemetrySuccess(action=action)
+
+    metadata = _json_loads(metadata)
+    client_time = _EPOCH + timedelta(milliseconds=int(client_time))
     log_action(
         instance=instance,
         action=action,
@@ -1,4 +1,5 @@
-from typing import Dict, Generator, cast
+import weakref
+from typing import Dict, Generator, Optional, Set, cast
 
 import dagster._check as check
 from dagster.config.field import Field
@@ -9,32 +10,70 @@
 
 def iterate_config_types(config_type: ConfigType) -> Generator[ConfigType, None, None]:
     check.inst_param(config_type, "config_type", ConfigType)
+    return _iterate_config_types(config_type, None)
+
+
+def iterate_unseen_config_types(
+    config_type: ConfigType, seen_type_ids: Set[int]
+) -> Generator[ConfigType, None, None]:
+    """Like iterate_config_types, but skips types whose id is in seen_type_ids, along with
+    everything beneath them, and records the id of every type it yields. Walking several schemas
+    that share types with the same set visits each distinct type once.
+    """
+    check.inst_param(config_type, "config_type", ConfigType)
+    check.inst_param(seen_type_ids, "seen_type_ids", set)
+    return _iterate_config_types(config_type, seen_type_ids)
+
+
+def _iterate_config_types(
+    config_type: ConfigType, seen_type_ids: Optional[Set[int]]
+) -> Generator[ConfigType, None, None]:
+    # everything reachable from a type is yielded before the type itself, so a type that has
+    # already been seen has had its whole subtree seen too
+    if seen_type_ids is not None and id(config_type) in seen_type_ids:
+        return
 
     # type-ignore comments below are because static type checkers don't
     # understand the `ConfigTypeKind` system.
     if config_type.kind == ConfigTypeKind.MAP:
-        yield from iterate_config_types(config_type.key_type)  # type: ignore
-        yield from iterate_config_types(config_type.inner_type)  # type: ignore
+        yield from _iterate_config_types(config_type.key_type, seen_type_ids)  # type: ignore
+        yield from _iterate_config_types(config_type.inner_type, seen_type_ids)  # type: ignore
 
     if config_type.kind == ConfigTypeKind.ARRAY or config_type.kind == ConfigTypeKind.NONEABLE:
-        yield from iterate_config_types(config_type.inner_type)  # type: ignore
+        yield from _iterate_config_types(config_type.inner_type, seen_type_ids)  # type: ignore
 
     if ConfigTypeKind.has_fields(config_type.kind):
         fields = cast(Dict[str, Field], config_type.fields)  # type: ignore
         for field in fields.values():
-            yield from iterate_config_types(field.config_type)
+            yield from _iterate_config_types(field.config_type, seen_type_ids)
 
     if config_type.kind == ConfigTypeKind.SCALAR_UNION:
-        yield config_type.scalar_type  # type: ignore
-        yield from iterate_config_types(config_type.non_scalar_type)  # type: ignore
+        # the scalar side is a leaf, so walking it yields just the scalar type itself
+        yield from _iterate_config_types(config_type.scalar_type, seen_type_ids)  # type: ignore
+        yield from _iterate_config_types(config_type.non_scalar_type, seen_type_ids)  # type: ignore
 
+    if seen_type_ids is not None:
+        seen_type_ids.add(id(config_type))
     yield config_type
 
 
+# Validating or post-processing a config value needs a snapshot of every type reachable from the
+# schema. Schemas such as a pipeline's run config type are validated many times over their
+# lifetime, so the walk over the schema is done once per config type object rather than once per
+# value processed.
+_CONFIG_SCHEMA_SNAPSHOT_CACHE: "weakref.WeakKeyDictionary[ConfigType, ConfigSchemaSnapshot]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def config_schema_snapshot_from_config_type(
     config_type: ConfigType,
 ) -> ConfigSchemaSnapshot:
     check.inst_param(config_type, "config_type", ConfigType)
-    return ConfigSchemaSnapshot(
-        {ct.key: snap_from_config_type(ct) for ct in iterate_config_types(config_type)}
-    )
+    snapshot = _CONFIG_SCHEMA_SNAPSHOT_CACHE.get(config_type)
+    if snapshot is None:
+        snapshot = ConfigSchemaSnapshot(
+            {ct.key: snap_from_config_type(ct) for ct in iterate_config_types(config_type)}
+        )
+        _CONFIG_SCHEMA_SNAPSHOT_CACHE[config_type] = snapshot
+    return snapshot
@@ -37,7 +37,7 @@ def post_process(self, value):
         if not isinstance(value, dict):
             return value
 
-        key, cfg = list(value.items())[0]
+        key, cfg = next(iter(value.items()))
         check.invariant(key == "env", "Only valid key is env")
         return str(_ensure_env_variable(cfg))
 
@@ -58,7 +58,7 @@ def post_process(self, value):
 
         check.invariant(len(value) == 1, "Selector should have one entry")
 
-        key, cfg = list(value.items())[0]
+        key, cfg = next(iter(value.items()))
         check.invariant(key == "env", "Only valid key is env")
         value = _ensure_env_variable(cfg)
         try:
@@ -88,7 +88,7 @@ def post_process(self, value):
 
         check.invariant(len(value) == 1, "Selector should have one entry")
 
-        key, cfg = list(value.items())[0]
+        key, cfg = next(iter(value.items()))
         check.invariant(key == "env", "Only valid key is env")
         value = _ensure_env_variable(cfg)
         try:
@@ -1,12 +1,11 @@
 from enum import Enum
-from typing import Dict
 
 import dagster._check as check
 
 from .config_type import ConfigType
 from .field import Field
-from .iterate_types import config_schema_snapshot_from_config_type, iterate_config_types
-from .snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap, snap_from_config_type
+from .iterate_types import config_schema_snapshot_from_config_type
+from .snap import ConfigFieldSnap, ConfigSchemaSnapshot, ConfigTypeSnap
 from .stack import EvaluationStack
 
 
@@ -109,7 +108,7 @@ def for_nullable_inner_type(self) -> "ValidationContext":
 
 
 class TraversalContext(ContextData):
-    __slots__ = ["_config_type", "_traversal_type", "_all_config_types"]
+    __slots__ = ["_config_type", "_traversal_type"]
 
     def __init__(
         self,
@@ -118,7 +117,6 @@ def __init__(
         config_type: ConfigType,
         stack: EvaluationStack,
         traversal_type: TraversalType,
-        all_config_types: Dict[str, ConfigType],
     ):
         super(TraversalContext, self).__init__(
             config_schema_snapshot=config_schema_snapshot,
@@ -127,29 +125,20 @@ def __init__(
         )
         self._config_type = check.inst_param(config_type, "config_type", ConfigType)
         self._traversal_type = check.inst_param(traversal_type, "traversal_type", TraversalType)
-        self._all_config_types = check.dict_param(
-            all_config_types, "all_config_types", key_type=str, value_type=ConfigType
-        )
 
     @staticmethod
     def from_config_type(
         config_type: ConfigType, stack: EvaluationStack, traversal_type: TraversalType
     ) -> "TraversalContext":
-        all_config_types = list(iterate_config_types(config_type))
         config_schema_snapshot = config_schema_snapshot_from_config_type(config_type)
         return TraversalContext(
             config_schema_snapshot=config_schema_snapshot,
-            config_type_snap=snap_from_config_type(config_type),
+            config_type_snap=config_schema_snapshot.get_config_snap(config_type.key),
             config_type=config_type,
             stack=stack,
             traversal_type=traversal_type,
-            all_config_types={ct.key: ct for ct in all_config_types},
         )
 
-    @property
-    def all_config_types(self) -> Dict[str, ConfigType]:
-        return self._all_config_types
-
     @property
     def config_type(self) -> ConfigType:
         return self._config_type
@@ -172,7 +161,6 @@ def for_array(self, index: int) -> "TraversalContext":
             config_type=self.config_type.inner_type,  # type: ignore
             stack=self.stack.for_array_index(index),
             traversal_type=self.traversal_type,
-            all_config_types=self.all_config_types,
         )
 
     def for_map(self, key: object) -> "TraversalContext":
@@ -184,7 +172,6 @@ def for_map(self, key: object) -> "TraversalContext":
             config_type=self.config_type.inner_type,  # type: ignore
             stack=self.stack.for_map_value(key),
             traversal_type=self.traversal_type,
-            all_config_types=self.all_config_types,
         )
 
     def for_field(self, field_def: Field, field_name: str) -> "TraversalContext":
@@ -196,7 +183,6 @@ def for_field(self, field_def: Field, field_name: str) -> "TraversalContext":
             config_type=field_def.config_type,
             stack=self.stack.for_field(field_name),
             traversal_type=self.traversal_type,
-            all_config_types=self.all_config_types,
         )
 
     def for_nullable_inner_type(self) -> "TraversalContext":
@@ -208,7 +194,6 @@ def for_nullable_inner_type(self) -> "TraversalContext":
             config_type=self.config_type.inner_type,  # type: ignore
             stack=self.stack,
             traversal_type=self.traversal_type,
-            all_config_types=self.all_config_types,
         )
 
     def for_new_config_type(self, config_type: ConfigType) -> "TraversalContext":
@@ -218,5 +203,4 @@ def for_new_config_type(self, config_type: ConfigType) -> "TraversalContext":
             config_type=config_type,
             stack=self.stack,
             traversal_type=self.traversal_type,
-            all_config_types=self.all_config_types,
         )
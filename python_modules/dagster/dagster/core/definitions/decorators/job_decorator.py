@@ -27,8 +27,36 @@
     from ..executor_definition import ExecutorDefinition
     from ..partition import PartitionedConfig, PartitionsDefinition
 
+_do_composition = None
+
+
+def _get_do_composition():
+    # do_composition can't be imported at module load because of a circular import through
+    # dagster.core.definitions.composition, so resolve it on first use and keep a reference
+    global _do_composition  # pylint: disable=global-statement
+    if _do_composition is None:
+        from dagster.core.definitions.decorators.composite_solid_decorator import do_composition
+
+        _do_composition = do_composition
+    return _do_composition
+
 
 class _Job:
+    __slots__ = (
+        "name",
+        "description",
+        "tags",
+        "resource_defs",
+        "config",
+        "logger_defs",
+        "executor_def",
+        "hooks",
+        "op_retry_policy",
+        "version_strategy",
+        "partitions_def",
+        "input_values",
+    )
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -63,42 +91,13 @@ def __call__(self, fn: Callable[..., Any]) -> JobDefinition:
         if not self.name:
             self.name = fn.__name__
 
-        from dagster.core.definitions.decorators.composite_solid_decorator import do_composition
-
-        (
-            input_mappings,
-            output_mappings,
-            dependencies,
-            solid_defs,
-            config_mapping,
-            positional_inputs,
-        ) = do_composition(
-            decorator_name="@job",
-            graph_name=self.name,
-            fn=fn,
-            provided_input_defs=[],
-            provided_output_defs=[],
-            ignore_output_from_composition_fn=False,
-            config_mapping=None,
-        )
-
-        graph_def = GraphDefinition(
+        return _build_job_def(
+            fn,
             name=self.name,
-            dependencies=dependencies,
-            node_defs=solid_defs,
-            description=self.description or format_docstring_for_description(fn),
-            input_mappings=input_mappings,
-            output_mappings=output_mappings,
-            config=config_mapping,
-            positional_inputs=positional_inputs,
+            description=self.description,
             tags=self.tags,
-        )
-
-        job_def = graph_def.to_job(
-            description=self.description or format_docstring_for_description(fn),
             resource_defs=self.resource_defs,
             config=self.config,
-            tags=self.tags,
             logger_defs=self.logger_defs,
             executor_def=self.executor_def,
             hooks=self.hooks,
@@ -107,8 +106,69 @@ def __call__(self, fn: Callable[..., Any]) -> JobDefinition:
             partitions_def=self.partitions_def,
             input_values=self.input_values,
         )
-        update_wrapper(job_def, fn)
-        return job_def
+
+
+def _build_job_def(
+    fn: Callable[..., Any],
+    name: str,
+    description: Optional[str] = None,
+    tags: Optional[Dict[str, Any]] = None,
+    resource_defs: Optional[Dict[str, ResourceDefinition]] = None,
+    config: Optional[Union[ConfigMapping, Dict[str, Any], "PartitionedConfig"]] = None,
+    logger_defs: Optional[Dict[str, LoggerDefinition]] = None,
+    executor_def: Optional["ExecutorDefinition"] = None,
+    hooks: Optional[AbstractSet[HookDefinition]] = None,
+    op_retry_policy: Optional[RetryPolicy] = None,
+    version_strategy: Optional[VersionStrategy] = None,
+    partitions_def: Optional["PartitionsDefinition"] = None,
+    input_values: Optional[Mapping[str, object]] = None,
+) -> JobDefinition:
+    (
+        input_mappings,
+        output_mappings,
+        dependencies,
+        solid_defs,
+        config_mapping,
+        positional_inputs,
+    ) = _get_do_composition()(
+        decorator_name="@job",
+        graph_name=name,
+        fn=fn,
+        provided_input_defs=[],
+        provided_output_defs=[],
+        ignore_output_from_composition_fn=False,
+        config_mapping=None,
+    )
+
+    description = description or format_docstring_for_description(fn)
+
+    graph_def = GraphDefinition(
+        name=name,
+        dependencies=dependencies,
+        node_defs=solid_defs,
+        description=description,
+        input_mappings=input_mappings,
+        output_mappings=output_mappings,
+        config=config_mapping,
+        positional_inputs=positional_inputs,
+        tags=tags,
+    )
+
+    job_def = graph_def.to_job(
+        description=description,
+        resource_defs=resource_defs,
+        config=config,
+        tags=tags,
+        logger_defs=logger_defs,
+        executor_def=executor_def,
+        hooks=hooks,
+        op_retry_policy=op_retry_policy,
+        version_strategy=version_strategy,
+        partitions_def=partitions_def,
+        input_values=input_values,
+    )
+    update_wrapper(job_def, fn)
+    return job_def
 
 
 @overload
@@ -201,7 +261,10 @@ def job(
     """
     if callable(name):
         check.invariant(description is None)
-        return _Job()(name)
+        # bare @job: build the definition directly rather than through a throwaway _Job
+        fn = name
+        check.callable_param(fn, "fn")
+        return _build_job_def(fn, name=fn.__name__)
 
     return _Job(
         name=name,
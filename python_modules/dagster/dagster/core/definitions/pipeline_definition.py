@@ -1135,14 +1135,11 @@ def _create_run_config_schema(
     if outer_config_type is None:
         check.failed("Unexpected outer_config_type value of None")
 
-    config_type_dict_by_name, config_type_dict_by_key = construct_config_type_dictionary(
-        pipeline_def.all_node_defs,
-        outer_config_type,
-    )
-
     return RunConfigSchema(
         run_config_schema_type=run_config_schema_type,
-        config_type_dict_by_name=config_type_dict_by_name,
-        config_type_dict_by_key=config_type_dict_by_key,
+        build_config_type_dictionaries=lambda: construct_config_type_dictionary(
+            pipeline_def.all_node_defs,
+            outer_config_type,
+        ),
         config_mapping=mode_definition.config_mapping,
     )
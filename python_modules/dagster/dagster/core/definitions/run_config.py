@@ -1,9 +1,24 @@
-from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Set, Tuple, cast
+import itertools
+import weakref
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
 
 from dagster.config import Field, Permissive, Selector
 from dagster.config.config_type import ALL_CONFIG_BUILTINS, Array, ConfigType
 from dagster.config.field_utils import Shape
-from dagster.config.iterate_types import iterate_config_types
+from dagster.config.iterate_types import iterate_config_types, iterate_unseen_config_types
 from dagster.core.definitions.executor_definition import (
     ExecutorDefinition,
     execute_in_process_executor,
@@ -19,48 +34,69 @@
 
 from .configurable import ConfigurableDefinition
 from .definition_config_schema import IDefinitionConfigSchema
-from .dependency import DependencyStructure, Node, NodeHandle, SolidInputHandle
+from .dependency import DependencyStructure, Node
 from .graph_definition import GraphDefinition
 from .logger_definition import LoggerDefinition
 from .mode import ModeDefinition
 from .resource_definition import ResourceDefinition
 from .solid_definition import NodeDefinition, SolidDefinition
 
+# Aliases letting "ops" and "solids" be used interchangeably as the key for a node dictionary.
+# Shared by every Shape built here; they must not be mutated.
+OP_FIELD_ALIASES = {"ops": "solids"}
+SOLID_FIELD_ALIASES = {"solids": "ops"}
+
 
 def define_resource_dictionary_cls(
     resource_defs: Dict[str, ResourceDefinition],
     required_resources: Set[str],
 ) -> Shape:
-    fields = {}
-    for resource_name, resource_def in resource_defs.items():
-        if resource_def.config_schema:
-            is_required = None
-            if resource_name not in required_resources:
-                # explicitly make section not required if resource is not required
-                # for the current mode
-                is_required = False
-
-            fields[resource_name] = def_config_field(
-                resource_def,
-                is_required=is_required,
-            )
-
+    # explicitly make section not required if resource is not required for the current mode
+    fields = {
+        resource_name: def_config_field(
+            resource_def,
+            is_required=None if resource_name in required_resources else False,
+        )
+        for resource_name, resource_def in resource_defs.items()
+        if resource_def.config_schema
+    }
     return Shape(fields=fields)
 
 
-def remove_none_entries(ddict: dict) -> dict:
-    return {k: v for k, v in ddict.items() if v is not None}
+# Definitions are immutable and hash by identity, so the same resource / logger / executor
+# referenced from many schemas (one per mode, job, or selector) can share a single Field. Keyed
+# weakly so that the cache doesn't keep definitions alive.
+_DEF_CONFIG_FIELDS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
 
 
 def def_config_field(
     configurable_def: ConfigurableDefinition, is_required: Optional[bool] = None
 ) -> Field:
-    return Field(
-        Shape(
+    fields_by_is_required = _DEF_CONFIG_FIELDS.get(configurable_def)
+    if fields_by_is_required is None:
+        fields_by_is_required = _DEF_CONFIG_FIELDS[configurable_def] = {}
+
+    field = fields_by_is_required.get(is_required)
+    if field is None:
+        field = Field(_def_config_shape(configurable_def), is_required=is_required)
+        fields_by_is_required[is_required] = field
+    return field
+
+
+# Shapes are interned by content hash, so every field built for a definition already wraps the same
+# Shape instance. Keeping it per definition skips rehashing its config schema for each distinct
+# is_required the definition is requested with (e.g. a resource required in one mode only).
+_DEF_CONFIG_SHAPES: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _def_config_shape(configurable_def: ConfigurableDefinition) -> Shape:
+    shape = _DEF_CONFIG_SHAPES.get(configurable_def)
+    if shape is None:
+        shape = Shape(
             {"config": configurable_def.config_field} if configurable_def.has_config_field else {}
-        ),
-        is_required=is_required,
-    )
+        )
+        _DEF_CONFIG_SHAPES[configurable_def] = shape
+    return shape
 
 
 class RunConfigSchemaCreationData(NamedTuple):
@@ -133,15 +169,18 @@ def define_run_config_schema_type(creation_data: RunConfigSchemaCreationData) ->
                 creation_data.required_resources,
             )
         ),
-        "inputs": get_inputs_field(
-            solid=top_level_node,
-            dependency_structure=creation_data.dependency_structure,
-            resource_defs=creation_data.mode_definition.resource_defs,
-            solid_ignored=False,
-            direct_inputs=creation_data.direct_inputs,
-        ),
     }
 
+    inputs_field = get_inputs_field(
+        solid=top_level_node,
+        dependency_structure=creation_data.dependency_structure,
+        resource_defs=creation_data.mode_definition.resource_defs,
+        solid_ignored=False,
+        direct_inputs=creation_data.direct_inputs,
+    )
+    if inputs_field is not None:
+        fields["inputs"] = inputs_field
+
     if creation_data.graph_def.has_config_mapping:
         config_schema = cast(IDefinitionConfigSchema, creation_data.graph_def.config_schema)
         nodes_field = Field({"config": config_schema.as_field()})
@@ -158,13 +197,13 @@ def define_run_config_schema_type(creation_data: RunConfigSchemaCreationData) ->
 
     if creation_data.is_using_graph_job_op_apis:
         fields["ops"] = nodes_field
-        field_aliases = {"ops": "solids"}
+        field_aliases = OP_FIELD_ALIASES
     else:
         fields["solids"] = nodes_field
-        field_aliases = {"solids": "ops"}
+        field_aliases = SOLID_FIELD_ALIASES
 
     return Shape(
-        fields=remove_none_entries(fields),
+        fields=fields,
         field_aliases=field_aliases,
     )
 
@@ -181,12 +220,27 @@ def get_inputs_field(
     resource_defs: Dict[str, ResourceDefinition],
     solid_ignored: bool,
     direct_inputs: Optional[Mapping[str, Any]] = None,
+):
+    return _get_inputs_field(
+        solid,
+        inputs_with_upstream(solid, dependency_structure),
+        resource_defs,
+        solid_ignored,
+        direct_inputs,
+    )
+
+
+def _get_inputs_field(
+    solid: Node,
+    upstream_input_names: AbstractSet[str],
+    resource_defs: Dict[str, ResourceDefinition],
+    solid_ignored: bool,
+    direct_inputs: Optional[Mapping[str, Any]] = None,
 ):
     direct_inputs = check.opt_mapping_param(direct_inputs, "direct_inputs")
     inputs_field_fields = {}
     for name, inp in solid.definition.input_dict.items():
-        inp_handle = SolidInputHandle(solid, inp)
-        has_upstream = input_has_upstream(dependency_structure, inp_handle, solid, name)
+        has_upstream = name in upstream_input_names
         if name in direct_inputs and not has_upstream:
             input_field = None
         elif inp.root_manager_key and not has_upstream:
@@ -212,13 +266,18 @@ def get_inputs_field(
         return Field(Shape(inputs_field_fields))
 
 
-def input_has_upstream(
-    dependency_structure: DependencyStructure,
-    input_handle: SolidInputHandle,
-    solid: Node,
-    input_name: str,
-) -> bool:
-    return dependency_structure.has_deps(input_handle) or solid.container_maps_input(input_name)
+def inputs_with_upstream(solid: Node, dependency_structure: DependencyStructure) -> FrozenSet[str]:
+    """Names of the solid's inputs that are satisfied by an upstream output or by an input mapping
+    on the containing graph, and so can't be provided through config."""
+    input_names_with_deps = {
+        input_handle.input_name
+        for input_handle in dependency_structure.input_to_upstream_outputs_for_solid(solid.name)
+    }
+    return frozenset(
+        name
+        for name in solid.definition.input_dict
+        if name in input_names_with_deps or solid.container_maps_input(name)
+    )
 
 
 def get_input_manager_input_field(
@@ -263,25 +322,25 @@ def get_outputs_field(
 ) -> Optional[Field]:
 
     # if any outputs have configurable output managers, use those for the schema and ignore all type
-    # materializers
+    # materializers. Every output is still checked against resource_defs, so a missing or invalid
+    # io manager is reported regardless of which schema is used.
     output_manager_fields = {}
+    type_materializer_fields = {}
     for name, output_def in solid.definition.output_dict.items():
         output_manager_output_field = get_output_manager_output_field(
             solid, output_def, resource_defs
         )
         if output_manager_output_field:
             output_manager_fields[name] = output_manager_output_field
+        elif not output_manager_fields:
+            type_output_field = get_type_output_field(output_def)
+            if type_output_field:
+                type_materializer_fields[name] = type_output_field
 
     if output_manager_fields:
         return Field(Shape(output_manager_fields))
 
     # otherwise, use any type materializers for the schema
-    type_materializer_fields = {}
-    for name, output_def in solid.definition.output_dict.items():
-        type_output_field = get_type_output_field(output_def)
-        if type_output_field:
-            type_materializer_fields[name] = type_output_field
-
     if type_materializer_fields:
         return Field(Array(Shape(type_materializer_fields)), is_required=False)
 
@@ -321,56 +380,99 @@ def get_type_output_field(output_def: OutputDefinition) -> Optional[Field]:
     return None
 
 
+def node_io_fields(
+    solid: Node,
+    upstream_input_names: AbstractSet[str],
+    resource_defs: Dict[str, ResourceDefinition],
+    ignored: bool,
+) -> Dict[str, Field]:
+    """The "inputs" and "outputs" entries shared by every node's config, omitting empty ones."""
+    fields = {}
+    inputs_field = _get_inputs_field(solid, upstream_input_names, resource_defs, ignored)
+    if inputs_field is not None:
+        fields["inputs"] = inputs_field
+    outputs_field = get_outputs_field(solid, resource_defs)
+    if outputs_field is not None:
+        fields["outputs"] = outputs_field
+    return fields
+
+
 def solid_config_field(
-    fields: Dict[str, Optional[Field]], ignored: bool, is_using_graph_job_op_apis: bool
+    fields: Dict[str, Field], ignored: bool, is_using_graph_job_op_apis: bool
 ) -> Optional[Field]:
-    field_aliases = {"ops": "solids"} if is_using_graph_job_op_apis else {"solids": "ops"}
-    trimmed_fields = remove_none_entries(fields)
-    if trimmed_fields:
+    field_aliases = OP_FIELD_ALIASES if is_using_graph_job_op_apis else SOLID_FIELD_ALIASES
+    if fields:
         if ignored:
             return Field(
-                Shape(trimmed_fields, field_aliases=field_aliases),
+                Shape(fields, field_aliases=field_aliases),
                 is_required=False,
                 description="This solid is not present in the current solid selection, "
                 "the config values are allowed but ignored.",
             )
         else:
-            return Field(Shape(trimmed_fields, field_aliases=field_aliases))
+            return Field(Shape(fields, field_aliases=field_aliases))
     else:
         return None
 
 
 def construct_leaf_solid_config(
     solid: Node,
-    dependency_structure: DependencyStructure,
+    upstream_input_names: AbstractSet[str],
     config_schema: Optional[IDefinitionConfigSchema],
     resource_defs: Dict[str, ResourceDefinition],
     ignored: bool,
     is_using_graph_job_op_apis: bool,
 ) -> Optional[Field]:
+    fields = node_io_fields(solid, upstream_input_names, resource_defs, ignored)
+    if config_schema:
+        fields["config"] = config_schema.as_field()
+
     return solid_config_field(
-        {
-            "inputs": get_inputs_field(
-                solid,
-                dependency_structure,
-                resource_defs,
-                ignored,
-            ),
-            "outputs": get_outputs_field(solid, resource_defs),
-            "config": config_schema.as_field() if config_schema else None,
-        },
+        fields,
         ignored=ignored,
         is_using_graph_job_op_apis=is_using_graph_job_op_apis,
     )
 
 
+# Within a single schema build, the field for a node depends only on its definition, whether it
+# is ignored, and which of its inputs are satisfied upstream -- not on where it sits in the graph.
+# Nodes that reuse the same definition (including whole composite subtrees) share the field.
+NodeFieldCacheKey = Tuple[int, bool, AbstractSet[str]]
+NodeFieldCache = Dict[NodeFieldCacheKey, Optional[Field]]
+
+
 def define_isolid_field(
     solid: Node,
-    handle: NodeHandle,
     dependency_structure: DependencyStructure,
     resource_defs: Dict[str, ResourceDefinition],
     ignored: bool,
     is_using_graph_job_op_apis: bool,
+    node_field_cache: Optional[NodeFieldCache] = None,
+) -> Optional[Field]:
+    if node_field_cache is None:
+        node_field_cache = {}
+
+    upstream_input_names = inputs_with_upstream(solid, dependency_structure)
+    cache_key = (id(solid.definition), ignored, upstream_input_names)
+    if cache_key not in node_field_cache:
+        node_field_cache[cache_key] = _define_isolid_field(
+            solid,
+            upstream_input_names,
+            resource_defs,
+            ignored,
+            is_using_graph_job_op_apis,
+            node_field_cache,
+        )
+    return node_field_cache[cache_key]
+
+
+def _define_isolid_field(
+    solid: Node,
+    upstream_input_names: AbstractSet[str],
+    resource_defs: Dict[str, ResourceDefinition],
+    ignored: bool,
+    is_using_graph_job_op_apis: bool,
+    node_field_cache: NodeFieldCache,
 ) -> Optional[Field]:
 
     # All solids regardless of compositing status get the same inputs and outputs
@@ -386,7 +488,7 @@ def define_isolid_field(
     if isinstance(solid.definition, SolidDefinition):
         return construct_leaf_solid_config(
             solid,
-            dependency_structure,
+            upstream_input_names,
             solid.definition.config_schema,
             resource_defs,
             ignored,
@@ -400,7 +502,7 @@ def define_isolid_field(
         # be `configured`)...
         return construct_leaf_solid_config(
             solid,
-            dependency_structure,
+            upstream_input_names,
             # ...and in both cases, the correct schema for 'config' key is exposed by this property:
             graph_def.config_schema,
             resource_defs,
@@ -410,23 +512,15 @@ def define_isolid_field(
         # This case omits a 'solids' key, thus if a composite solid is `configured` or has a field
         # mapping, the user cannot stub any config, inputs, or outputs for inner (child) solids.
     else:
-        fields = {
-            "inputs": get_inputs_field(
-                solid,
-                dependency_structure,
-                resource_defs,
-                ignored,
-            ),
-            "outputs": get_outputs_field(solid, resource_defs),
-        }
+        fields = node_io_fields(solid, upstream_input_names, resource_defs, ignored)
         nodes_field = Field(
             define_solid_dictionary_cls(
                 solids=graph_def.solids,
                 ignored_solids=None,
                 dependency_structure=graph_def.dependency_structure,
-                parent_handle=handle,
                 resource_defs=resource_defs,
                 is_using_graph_job_op_apis=is_using_graph_job_op_apis,
+                node_field_cache=node_field_cache,
             )
         )
         if is_using_graph_job_op_apis:
@@ -445,19 +539,21 @@ def define_solid_dictionary_cls(
     dependency_structure: DependencyStructure,
     resource_defs: Dict[str, ResourceDefinition],
     is_using_graph_job_op_apis: bool,
-    parent_handle: Optional[NodeHandle] = None,
+    node_field_cache: Optional[NodeFieldCache] = None,
 ) -> Shape:
     ignored_solids = check.opt_list_param(ignored_solids, "ignored_solids", of_type=Node)
+    if node_field_cache is None:
+        node_field_cache = {}
 
     fields = {}
     for solid in solids:
         solid_field = define_isolid_field(
             solid,
-            NodeHandle(solid.name, parent_handle),
             dependency_structure,
             resource_defs,
             ignored=False,
             is_using_graph_job_op_apis=is_using_graph_job_op_apis,
+            node_field_cache=node_field_cache,
         )
 
         if solid_field:
@@ -466,47 +562,63 @@ def define_solid_dictionary_cls(
     for solid in ignored_solids:
         solid_field = define_isolid_field(
             solid,
-            NodeHandle(solid.name, parent_handle),
             dependency_structure,
             resource_defs,
             ignored=True,
             is_using_graph_job_op_apis=is_using_graph_job_op_apis,
+            node_field_cache=node_field_cache,
         )
         if solid_field:
             fields[solid.name] = solid_field
 
-    field_aliases = {"ops": "solids"} if is_using_graph_job_op_apis else {"solids": "ops"}
+    field_aliases = OP_FIELD_ALIASES if is_using_graph_job_op_apis else SOLID_FIELD_ALIASES
     return Shape(fields, field_aliases=field_aliases)
 
 
 def iterate_node_def_config_types(node_def: NodeDefinition) -> Iterator[ConfigType]:
-    if isinstance(node_def, SolidDefinition):
-        if node_def.has_config_field:
-            yield from iterate_config_types(node_def.get_config_field().config_type)
-    elif isinstance(node_def, GraphDefinition):
-        for solid in node_def.solids:
-            yield from iterate_node_def_config_types(solid.definition)
-
-    else:
-        check.invariant("Unexpected NodeDefinition type {type}".format(type=type(node_def)))
+    for config_schema_type in _iterate_node_def_config_schema_types(node_def):
+        yield from iterate_config_types(config_schema_type)
+
+
+def _iterate_node_def_config_schema_types(node_def: NodeDefinition) -> Iterator[ConfigType]:
+    # walk with an explicit stack rather than recursing per graph level; children are pushed in
+    # reverse so that types are yielded in the same depth-first order as a recursive walk
+    stack = [node_def]
+    while stack:
+        current_def = stack.pop()
+        if isinstance(current_def, SolidDefinition):
+            if current_def.has_config_field:
+                yield current_def.get_config_field().config_type
+        elif isinstance(current_def, GraphDefinition):
+            stack.extend(solid.definition for solid in reversed(current_def.solids))
+        else:
+            check.failed("Unexpected NodeDefinition type {type}".format(type=type(current_def)))
 
 
-def _gather_all_schemas(node_defs: List[NodeDefinition]) -> Iterator[ConfigType]:
+def _gather_all_schemas(
+    node_defs: List[NodeDefinition], seen_type_ids: Set[int]
+) -> Iterator[ConfigType]:
     dagster_types = construct_dagster_type_dictionary(node_defs)
-    for dagster_type in list(dagster_types.values()) + list(ALL_RUNTIME_BUILTINS):
+    for dagster_type in itertools.chain(dagster_types.values(), ALL_RUNTIME_BUILTINS):
         if dagster_type.loader:
-            yield from iterate_config_types(dagster_type.loader.schema_type)
+            yield from iterate_unseen_config_types(dagster_type.loader.schema_type, seen_type_ids)
         if dagster_type.materializer:
-            yield from iterate_config_types(dagster_type.materializer.schema_type)
+            yield from iterate_unseen_config_types(
+                dagster_type.materializer.schema_type, seen_type_ids
+            )
 
 
 def _gather_all_config_types(
-    node_defs: List[NodeDefinition], run_config_schema_type: ConfigType
+    node_defs: List[NodeDefinition], run_config_schema_type: ConfigType, seen_type_ids: Set[int]
 ) -> Iterator[ConfigType]:
+    # The run config schema contains the config of every node, except for those beneath a config
+    # mapping, so the node configs can't be skipped outright. Walking them first means the schema
+    # walk prunes each node config subtree it reaches rather than visiting it a second time.
     for node_def in node_defs:
-        yield from iterate_node_def_config_types(node_def)
+        for config_schema_type in _iterate_node_def_config_schema_types(node_def):
+            yield from iterate_unseen_config_types(config_schema_type, seen_type_ids)
 
-    yield from iterate_config_types(run_config_schema_type)
+    yield from iterate_unseen_config_types(run_config_schema_type, seen_type_ids)
 
 
 def construct_config_type_dictionary(
@@ -515,11 +627,14 @@ def construct_config_type_dictionary(
 ) -> Tuple[Dict[str, ConfigType], Dict[str, ConfigType]]:
     type_dict_by_name = {t.given_name: t for t in ALL_CONFIG_BUILTINS if t.given_name}
     type_dict_by_key = {t.key: t for t in ALL_CONFIG_BUILTINS}
-    all_types = list(_gather_all_config_types(node_defs, run_config_schema_type)) + list(
-        _gather_all_schemas(node_defs)
-    )
+    # the same type object is commonly reachable from many places in the schema; it only needs to
+    # be visited and registered once
+    seen_type_ids: Set[int] = set()
 
-    for config_type in all_types:
+    for config_type in itertools.chain(
+        _gather_all_config_types(node_defs, run_config_schema_type, seen_type_ids),
+        _gather_all_schemas(node_defs, seen_type_ids),
+    ):
         name = config_type.given_name
         if name and name in type_dict_by_name:
             if type(config_type) is not type(type_dict_by_name[name]):
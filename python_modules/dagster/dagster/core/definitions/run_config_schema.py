@@ -1,17 +1,55 @@
-from typing import Dict, Iterable, NamedTuple, Optional
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
 import dagster._check as check
 from dagster.config.config_type import ConfigType
 
 from .config import ConfigMapping
+from .graph_definition import GraphDefinition
 from .pipeline_definition import PipelineDefinition
 
+ConfigTypeDictionaries = Tuple[Dict[str, ConfigType], Dict[str, ConfigType]]
 
-class RunConfigSchema(NamedTuple):
-    run_config_schema_type: ConfigType
-    config_type_dict_by_name: Dict[str, ConfigType]
-    config_type_dict_by_key: Dict[str, ConfigType]
-    config_mapping: Optional[ConfigMapping]
+
+class RunConfigSchema:
+    """The run config schema for a pipeline in a given mode.
+
+    The name- and key-indexed dictionaries of every config type reachable from the schema are
+    built on first access rather than with the schema. Building them also checks that config type
+    names are unique, so run config validation forces them before it starts.
+
+    The schemas for the nodes inside config-mapped graphs are only needed once a mapping has been
+    applied, so composite descent builds them on demand and keeps them in
+    ``config_mapped_node_types`` for the lifetime of this schema.
+    """
+
+    def __init__(
+        self,
+        run_config_schema_type: ConfigType,
+        build_config_type_dictionaries: Callable[[], ConfigTypeDictionaries],
+        config_mapping: Optional[ConfigMapping],
+    ):
+        self.run_config_schema_type = check.inst_param(
+            run_config_schema_type, "run_config_schema_type", ConfigType
+        )
+        self._build_config_type_dictionaries = check.callable_param(
+            build_config_type_dictionaries, "build_config_type_dictionaries"
+        )
+        self.config_mapping = check.opt_inst_param(config_mapping, "config_mapping", ConfigMapping)
+        self._config_type_dictionaries: Optional[ConfigTypeDictionaries] = None
+        self.config_mapped_node_types: Dict[Tuple[GraphDefinition, bool], ConfigType] = {}
+
+    def _get_config_type_dictionaries(self) -> ConfigTypeDictionaries:
+        if self._config_type_dictionaries is None:
+            self._config_type_dictionaries = self._build_config_type_dictionaries()
+        return self._config_type_dictionaries
+
+    @property
+    def config_type_dict_by_name(self) -> Dict[str, ConfigType]:
+        return self._get_config_type_dictionaries()[0]
+
+    @property
+    def config_type_dict_by_key(self) -> Dict[str, ConfigType]:
+        return self._get_config_type_dictionaries()[1]
 
     def has_config_type(self, name: str) -> bool:
         check.str_param(name, "name")
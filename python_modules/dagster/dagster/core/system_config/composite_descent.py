@@ -1,7 +1,8 @@
-from typing import NamedTuple, Optional
+from typing import Dict, NamedTuple, Optional, Tuple
 
 import dagster._check as check
 from dagster.config.evaluate_value_result import EvaluateValueResult
+from dagster.config.field_utils import Shape
 from dagster.config.validate import process_config
 from dagster.core.definitions.dependency import NodeHandle
 from dagster.core.definitions.graph_definition import GraphDefinition
@@ -18,6 +19,29 @@
 from dagster.utils.merger import merge_dicts
 
 
+def _get_config_mapped_solids_type(
+    graph_def: GraphDefinition,
+    resource_defs: Dict[str, ResourceDefinition],
+    is_using_graph_job_op_apis: bool,
+    ignore_omitted_nodes: bool,
+    config_mapped_node_types: Dict[Tuple[GraphDefinition, bool], Shape],
+) -> Shape:
+    # resource_defs and the API flavor are fixed for a given pipeline and mode, so within one
+    # cache only the graph and whether its omitted nodes are ignored affect the schema
+    cache_key = (graph_def, ignore_omitted_nodes)
+    if cache_key not in config_mapped_node_types:
+        config_mapped_node_types[cache_key] = define_solid_dictionary_cls(
+            solids=graph_def.solids,
+            ignored_solids=(
+                graph_def.get_top_level_omitted_nodes() if ignore_omitted_nodes else None
+            ),
+            dependency_structure=graph_def.dependency_structure,
+            resource_defs=resource_defs,
+            is_using_graph_job_op_apis=is_using_graph_job_op_apis,
+        )
+    return config_mapped_node_types[cache_key]
+
+
 class SolidConfigEntry(
     NamedTuple("_SolidConfigEntry", [("handle", NodeHandle), ("solid_config", SolidConfig)])
 ):
@@ -58,7 +82,7 @@ def descend(self, solid):
         return self._replace(handle=NodeHandle(solid.name, parent=self.handle))
 
 
-def composite_descent(pipeline_def, solids_config, resource_defs):
+def composite_descent(pipeline_def, solids_config, resource_defs, config_mapped_node_types=None):
     """
     This function is responsible for constructing the dictionary
     of SolidConfig (indexed by handle) that will be passed into the
@@ -70,6 +94,9 @@ def composite_descent(pipeline_def, solids_config, resource_defs):
         pipeline_def (PipelineDefintion): PipelineDefinition
         solids_config (dict): Configuration for the solids in the pipeline. The "solids" entry
             of the run_config. Assumed to have already been validated.
+        config_mapped_node_types (Optional[dict]): Cache for the schemas of the nodes inside
+            config-mapped graphs. Only valid for a single pipeline and mode; if not provided, the
+            schemas are rebuilt on every call.
 
     Returns:
         Dict[str, SolidConfig]: A dictionary mapping string representations of NodeHandles to
@@ -80,6 +107,10 @@ def composite_descent(pipeline_def, solids_config, resource_defs):
     check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
     check.dict_param(solids_config, "solids_config")
     check.dict_param(resource_defs, "resource_defs", key_type=str, value_type=ResourceDefinition)
+    # an empty cache must be kept as-is rather than swapped for a fresh dict, so check it directly
+    if config_mapped_node_types is None:
+        config_mapped_node_types = {}
+    check.dict_param(config_mapped_node_types, "config_mapped_node_types")
 
     # If top-level graph has config mapping, apply that config mapping before descending.
     if pipeline_def.graph.has_config_mapping:
@@ -88,6 +119,7 @@ def composite_descent(pipeline_def, solids_config, resource_defs):
             solids_config,
             resource_defs,
             pipeline_def.is_job,  # pylint: disable=protected-access
+            config_mapped_node_types,
         )
 
     return {
@@ -97,11 +129,18 @@ def composite_descent(pipeline_def, solids_config, resource_defs):
             solids_config_dict=solids_config,
             resource_defs=resource_defs,
             is_using_graph_job_op_apis=pipeline_def.is_job,  # pylint: disable=protected-access
+            config_mapped_node_types=config_mapped_node_types,
         )
     }
 
 
-def _composite_descent(parent_stack, solids_config_dict, resource_defs, is_using_graph_job_op_apis):
+def _composite_descent(
+    parent_stack,
+    solids_config_dict,
+    resource_defs,
+    is_using_graph_job_op_apis,
+    config_mapped_node_types,
+):
     """
     The core implementation of composite_descent. This yields a stream of
     SolidConfigEntry. This is used by composite_descent to construct a
@@ -163,13 +202,18 @@ def _composite_descent(parent_stack, solids_config_dict, resource_defs, is_using
                 current_solid_config,
                 resource_defs,
                 is_using_graph_job_op_apis,
+                config_mapped_node_types,
             )
             if graph_def.has_config_mapping
             else current_solid_config.get(node_key, {})
         )
 
         yield from _composite_descent(
-            current_stack, solids_dict, resource_defs, is_using_graph_job_op_apis
+            current_stack,
+            solids_dict,
+            resource_defs,
+            is_using_graph_job_op_apis,
+            config_mapped_node_types,
         )
 
 
@@ -178,6 +222,7 @@ def _apply_top_level_config_mapping(
     outer_config,
     resource_defs,
     is_using_graph_job_op_apis,
+    config_mapped_node_types,
 ):
     graph_def = pipeline_def.graph
 
@@ -203,12 +248,12 @@ def _apply_top_level_config_mapping(
         # Dynamically construct the type that the output of the config mapping function will
         # be evaluated against
 
-        type_to_evaluate_against = define_solid_dictionary_cls(
-            solids=graph_def.solids,
-            ignored_solids=None,
-            dependency_structure=graph_def.dependency_structure,
-            resource_defs=resource_defs,
-            is_using_graph_job_op_apis=is_using_graph_job_op_apis,
+        type_to_evaluate_against = _get_config_mapped_solids_type(
+            graph_def,
+            resource_defs,
+            is_using_graph_job_op_apis,
+            ignore_omitted_nodes=False,
+            config_mapped_node_types=config_mapped_node_types,
         )
 
         # process against that new type
@@ -228,6 +273,7 @@ def _get_mapped_solids_dict(
     current_solid_config,
     resource_defs,
     is_using_graph_job_op_apis,
+    config_mapped_node_types,
 ):
     # the spec of the config mapping function is that it takes the dictionary at:
     # solid_name:
@@ -262,15 +308,12 @@ def _get_mapped_solids_dict(
 
     # diff original graph and the subselected graph to find nodes to ignore so the system knows to
     # skip the validation then when config mapping generates values where the nodes are not selected
-    ignored_solids = graph_def.get_top_level_omitted_nodes() if graph_def.is_subselected else None
-
-    type_to_evaluate_against = define_solid_dictionary_cls(
-        solids=graph_def.solids,
-        ignored_solids=ignored_solids,
-        dependency_structure=graph_def.dependency_structure,
-        parent_handle=current_stack.handle,
-        resource_defs=resource_defs,
-        is_using_graph_job_op_apis=is_using_graph_job_op_apis,
+    type_to_evaluate_against = _get_config_mapped_solids_type(
+        graph_def,
+        resource_defs,
+        is_using_graph_job_op_apis,
+        ignore_omitted_nodes=graph_def.is_subselected,
+        config_mapped_node_types=config_mapped_node_types,
     )
 
     # process against that new type
@@ -149,6 +149,10 @@ def build(
         mode = mode or pipeline_def.get_default_mode_name()
         run_config_schema = pipeline_def.get_run_config_schema(mode)
 
+        # building the config type dictionaries checks that type names are unique; a clash has to be
+        # reported before validation, which would otherwise fail with misleading errors
+        run_config_schema.all_config_types()
+
         if run_config_schema.config_mapping:
             # add user code boundary
             run_config = run_config_schema.config_mapping.resolve_from_unvalidated_config(
@@ -197,7 +201,10 @@ def build(
 
         node_key = "ops" if pipeline_def.is_job else "solids"
         solid_config_dict = composite_descent(
-            pipeline_def, config_value.get(node_key, {}), mode_def.resource_defs
+            pipeline_def,
+            config_value.get(node_key, {}),
+            mode_def.resource_defs,
+            run_config_schema.config_mapped_node_types,
         )
         input_configs = config_value.get("inputs", {})
 
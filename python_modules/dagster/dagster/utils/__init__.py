@@ -125,7 +125,7 @@ def camelcase(string):
 def ensure_single_item(ddict):
     check.dict_param(ddict, "ddict")
     check.param_invariant(len(ddict) == 1, "ddict", "Expected dict with single item")
-    return list(ddict.items())[0]
+    return next(iter(ddict.items()))
 
 
 @contextlib.contextmanager
@@ -0,0 +1,125 @@
+from unittest import mock
+
+import pytest
+
+from dagster import (
+    ConfigMapping,
+    DagsterInvalidConfigError,
+    Int,
+    ModeDefinition,
+    PipelineDefinition,
+    ResourceDefinition,
+    composite_solid,
+    graph,
+    op,
+    solid,
+)
+from dagster.core.system_config import composite_descent as composite_descent_module
+from dagster.core.system_config.objects import ResolvedRunConfig
+
+
+def _define_mapped_graph(config_fn):
+    @op(config_schema={"a_value": Int})
+    def op_a(context):
+        return context.op_config["a_value"]
+
+    @op(config_schema={"b_value": Int})
+    def op_b(context):
+        return context.op_config["b_value"]
+
+    @graph(config=ConfigMapping(config_schema={"value": Int}, config_fn=config_fn))
+    def mapped():
+        op_a()
+        op_b()
+
+    @graph
+    def outer():
+        mapped()
+
+    return outer
+
+
+def _map_to_both(cfg):
+    return {
+        "op_a": {"config": {"a_value": cfg["value"]}},
+        "op_b": {"config": {"b_value": cfg["value"]}},
+    }
+
+
+def _map_to_op_a(cfg):
+    return {"op_a": {"config": {"a_value": cfg["value"]}}}
+
+
+def _count_schema_builds():
+    return mock.patch.object(
+        composite_descent_module,
+        "define_solid_dictionary_cls",
+        wraps=composite_descent_module.define_solid_dictionary_cls,
+    )
+
+
+def test_config_mapped_graph_type_reused_across_validations():
+    job_def = _define_mapped_graph(_map_to_both).to_job()
+    run_config = {"ops": {"mapped": {"config": {"value": 1}}}}
+
+    with _count_schema_builds() as define_solid_dictionary_cls:
+        first = ResolvedRunConfig.build(job_def, run_config)
+        second = ResolvedRunConfig.build(job_def, run_config)
+
+    assert define_solid_dictionary_cls.call_count == 1
+    assert first.solids["mapped.op_b"].config == second.solids["mapped.op_b"].config == {
+        "b_value": 1
+    }
+
+
+def test_config_mapped_graph_type_subselection():
+    outer = _define_mapped_graph(_map_to_both)
+    full_job = outer.to_job()
+    subset_job = outer.to_job(op_selection=["mapped.op_a"])
+    run_config = {"ops": {"mapped": {"config": {"value": 1}}}}
+
+    # the config mapping still emits config for op_b, which is allowed only because it is omitted
+    ResolvedRunConfig.build(full_job, run_config)
+    resolved = ResolvedRunConfig.build(subset_job, run_config)
+    assert "mapped.op_b" not in resolved.solids
+
+    # op_b's config is required on the full graph but not on the subselected one
+    partial = _define_mapped_graph(_map_to_op_a)
+    ResolvedRunConfig.build(partial.to_job(op_selection=["mapped.op_a"]), run_config)
+    with pytest.raises(DagsterInvalidConfigError, match="op_b"):
+        ResolvedRunConfig.build(partial.to_job(), run_config)
+
+
+def test_config_mapped_graph_type_per_mode_resources():
+    @solid(config_schema={"value": Int})
+    def inner(context):
+        return context.solid_config["value"]
+
+    @composite_solid(
+        config_schema={"value": Int},
+        config_fn=lambda cfg: {"inner": {"config": {"value": cfg["value"]}}},
+    )
+    def mapped_composite():
+        inner()
+
+    pipeline_def = PipelineDefinition(
+        name="per_mode_resources",
+        solid_defs=[mapped_composite],
+        mode_defs=[
+            ModeDefinition(
+                name="one", resource_defs={"res": ResourceDefinition.hardcoded_resource(1)}
+            ),
+            ModeDefinition(
+                name="two", resource_defs={"res": ResourceDefinition.hardcoded_resource(2)}
+            ),
+        ],
+    )
+    run_config = {"solids": {"mapped_composite": {"config": {"value": 1}}}}
+
+    with _count_schema_builds() as define_solid_dictionary_cls:
+        for _ in range(3):
+            ResolvedRunConfig.build(pipeline_def, run_config, mode="one")
+            ResolvedRunConfig.build(pipeline_def, run_config, mode="two")
+
+    # built once per mode, however many times the run config is validated
+    assert define_solid_dictionary_cls.call_count == 2
@@ -1,8 +1,14 @@
 import re
 
+import pytest
+
 from dagster import (
     Any,
+    ConfigMapping,
+    DagsterInvalidDefinitionError,
     DependencyDefinition,
+    Enum,
+    EnumValue,
     Field,
     InputDefinition,
     Int,
@@ -15,16 +21,21 @@
     SolidDefinition,
     String,
     execute_pipeline,
+    graph,
     lambda_solid,
+    op,
     pipeline,
     solid,
 )
-from dagster.config.config_type import ConfigTypeKind
+from dagster.config.config_type import ALL_CONFIG_BUILTINS, ConfigTypeKind
+from dagster.config.iterate_types import iterate_config_types
 from dagster.config.validate import process_config
 from dagster.core.definitions import create_run_config_schema
 from dagster.core.definitions.run_config import (
     RunConfigSchemaCreationData,
+    construct_config_type_dictionary,
     define_solid_dictionary_cls,
+    iterate_node_def_config_types,
 )
 from dagster.core.system_config.objects import ResolvedRunConfig, ResourceConfig, SolidConfig
 from dagster.loggers import default_loggers
@@ -286,7 +297,6 @@ def test_solid_config_error():
         solids=pipeline_def.solids,
         ignored_solids=None,
         dependency_structure=pipeline_def.dependency_structure,
-        parent_handle=None,
         resource_defs={},
         is_using_graph_job_op_apis=False,
     )
@@ -613,6 +623,29 @@ def add_one(num):
     assert "inputs" not in solids_type.fields["second_add"].config_type.fields
 
 
+def test_aliased_solids_share_config_field():
+    @lambda_solid(input_defs=[InputDefinition("num", Int)], output_def=OutputDefinition(Int))
+    def add_one(num):
+        return num + 1
+
+    pipeline_def = PipelineDefinition(
+        name="aliased_solids",
+        solid_defs=[add_one],
+        dependencies={
+            NodeInvocation("add_one", "first_add"): {},
+            NodeInvocation("add_one", "second_add"): {},
+            NodeInvocation("add_one", "third_add"): {"num": DependencyDefinition("first_add")},
+        },
+    )
+
+    env_type = create_run_config_schema_type(pipeline_def)
+    solids_type = env_type.fields["solids"].config_type
+
+    # same definition with the same unsatisfied inputs resolves to the same field
+    assert solids_type.fields["first_add"] is solids_type.fields["second_add"]
+    assert "inputs" not in solids_type.fields["third_add"].config_type.fields
+
+
 def test_mix_required_inputs():
     @lambda_solid(
         input_defs=[InputDefinition("left", Int), InputDefinition("right", Int)],
@@ -642,3 +675,68 @@ def return_three():
 
 def test_directly_init_environment_config():
     ResolvedRunConfig()
+
+
+def test_config_type_dictionary_includes_config_mapped_node_types():
+    @op(config_schema={"inner_only": Field(Int)})
+    def inner_op():
+        pass
+
+    @graph(config=ConfigMapping(config_schema={"outer": Int}, config_fn=lambda c: {}))
+    def mapped_graph():
+        inner_op()
+
+    @op(config_schema={"top_level": Field(String)})
+    def top_op():
+        pass
+
+    @graph
+    def outer_graph():
+        mapped_graph()
+        top_op()
+
+    job_def = outer_graph.to_job()
+    run_config_schema = job_def.get_run_config_schema("default")
+    run_config_schema_type = run_config_schema.config_type
+
+    # the inner op's config is hidden behind the config mapping, so it is not reachable from the run
+    # config schema but still needs to be registered
+    inner_config_type = inner_op.config_schema.config_type
+    assert inner_config_type.key not in {
+        config_type.key for config_type in iterate_config_types(run_config_schema_type)
+    }
+
+    expected_keys = {config_type.key for config_type in ALL_CONFIG_BUILTINS}
+    for node_def in job_def.all_node_defs:
+        expected_keys.update(
+            config_type.key for config_type in iterate_node_def_config_types(node_def)
+        )
+    expected_keys.update(
+        config_type.key for config_type in iterate_config_types(run_config_schema_type)
+    )
+
+    _, type_dict_by_key = construct_config_type_dictionary(
+        job_def.all_node_defs, run_config_schema_type
+    )
+    assert expected_keys.issubset(type_dict_by_key.keys())
+    assert inner_config_type.key in type_dict_by_key
+    assert run_config_schema.config_type_dict_by_key.keys() == type_dict_by_key.keys()
+
+
+def test_duplicate_config_type_names():
+    @solid(config_schema={"count": Int, "choice": Enum("Int", [EnumValue("one")])})
+    def clashing_solid(_):
+        pass
+
+    @pipeline
+    def clashing_pipeline():
+        clashing_solid()
+
+    run_config = {"solids": {"clashing_solid": {"config": {"count": 1, "choice": "one"}}}}
+
+    # the clash is reported as such even though the type dictionaries are built lazily
+    with pytest.raises(DagsterInvalidDefinitionError, match="Type names must be unique"):
+        ResolvedRunConfig.build(clashing_pipeline, run_config)
+
+    with pytest.raises(DagsterInvalidDefinitionError, match="Type names must be unique"):
+        execute_pipeline(clashing_pipeline, run_config)
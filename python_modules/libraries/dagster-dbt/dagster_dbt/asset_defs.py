@@ -1,11 +1,10 @@
 import hashlib
-import json
 import os
 import textwrap
 from typing import AbstractSet, Any, Callable, Dict, Mapping, Optional, Sequence, Set, Tuple
 
 from dagster_dbt.cli.types import DbtCliOutput
-from dagster_dbt.cli.utils import execute_cli
+from dagster_dbt.cli.utils import execute_cli, json_loads
 from dagster_dbt.types import DbtOutput
 from dagster_dbt.utils import generate_events
 
@@ -26,6 +25,9 @@
 from dagster import get_dagster_logger, op
 from dagster.core.definitions.metadata import RawMetadataValue
 
+# the dbt resource types that are represented as assets
+_ASSET_DEP_TYPES = frozenset(("source", "model"))
+
 
 def _load_manifest_for_project(
     project_dir: str, profiles_dir: str, target_dir: str, select: str
@@ -48,8 +50,9 @@ def _load_manifest_for_project(
         target_path=target_dir,
     )
     manifest_path = os.path.join(target_dir, "manifest.json")
-    with open(manifest_path, "r", encoding="utf8") as f:
-        return json.load(f), cli_output
+    # manifests are utf-8 json, so both parsers can take the raw bytes in a single read
+    with open(manifest_path, "rb") as f:
+        return json_loads(f.read()), cli_output
 
 
 def _get_node_name(node_info: Mapping[str, Any]):
@@ -87,29 +90,46 @@ def _dbt_nodes_to_assets(
 ) -> AssetsDefinition:
 
     outs: Dict[str, Out] = {}
-    asset_ins: Dict[AssetKey, Tuple[str, In]] = {}
+    ins: Dict[str, In] = {}
+    asset_keys_by_input_name: Dict[str, AssetKey] = {}
 
     asset_deps: Dict[AssetKey, Set[AssetKey]] = {}
 
     out_name_to_node_info: Dict[str, Mapping[str, Any]] = {}
+    asset_keys_by_output_name: Dict[str, AssetKey] = {}
+
+    # a model or source is typically depended on by many of the selected models; resolve each
+    # node's asset key only once
+    asset_keys_by_unique_id: Dict[str, AssetKey] = {}
+
+    def _asset_key_for_node(unique_id: str, node_info: Mapping[str, Any]) -> AssetKey:
+        if unique_id not in asset_keys_by_unique_id:
+            asset_keys_by_unique_id[unique_id] = node_info_to_asset_key(node_info)
+        return asset_keys_by_unique_id[unique_id]
 
     package_name = None
-    for unique_id in selected_unique_ids:
+    # visit models in a fixed order so that the op and its outs come out identical in every process,
+    # rather than following set iteration order, which varies with string hash randomization
+    for unique_id in sorted(selected_unique_ids):
         cur_asset_deps = set()
         node_info = dbt_nodes[unique_id]
         package_name = node_info.get("package_name", package_name)
 
         for dep_name in node_info["depends_on"]["nodes"]:
-            dep_type = dbt_nodes[dep_name]["resource_type"]
+            dep_node_info = dbt_nodes[dep_name]
+            dep_type = dep_node_info["resource_type"]
 
             # ignore seeds/snapshots
-            if dep_type not in ["source", "model"]:
+            if dep_type not in _ASSET_DEP_TYPES:
                 continue
-            dep_asset_key = node_info_to_asset_key(dbt_nodes[dep_name])
+            dep_asset_key = _asset_key_for_node(dep_name, dep_node_info)
 
             # if it's a source, it will be used as an input to this multi-asset
             if dep_type == "source":
-                asset_ins[dep_asset_key] = (dep_name.replace(".", "_"), In(Nothing))
+                input_name = dep_name.replace(".", "_")
+                if input_name not in ins:
+                    ins[input_name] = In(Nothing)
+                    asset_keys_by_input_name[input_name] = dep_asset_key
 
             # regardless of type, list this as a dependency for the current asset
             cur_asset_deps.add(dep_asset_key)
@@ -125,7 +145,9 @@ def _dbt_nodes_to_assets(
         out_name_to_node_info[node_name] = node_info
 
         # set the asset dependencies for this asset
-        asset_deps[node_info_to_asset_key(node_info)] = cur_asset_deps
+        asset_key = _asset_key_for_node(unique_id, node_info)
+        asset_keys_by_output_name[node_name] = asset_key
+        asset_deps[asset_key] = cur_asset_deps
 
     # prevent op name collisions between multiple dbt multi-assets
     op_name = f"run_dbt_{package_name}"
@@ -135,7 +157,7 @@ def _dbt_nodes_to_assets(
     @op(
         name=op_name,
         tags={"kind": "dbt"},
-        ins=dict(asset_ins.values()),
+        ins=ins,
         out=outs,
         required_resource_keys={"dbt"},
     )
@@ -192,13 +214,8 @@ def dbt_op(context):
                     yield event
 
     return AssetsDefinition(
-        asset_keys_by_input_name={
-            input_name: asset_key for asset_key, (input_name, _) in asset_ins.items()
-        },
-        asset_keys_by_output_name={
-            output_name: node_info_to_asset_key(out_name_to_node_info[output_name])
-            for output_name in outs.keys()
-        },
+        asset_keys_by_input_name=asset_keys_by_input_name,
+        asset_keys_by_output_name=asset_keys_by_output_name,
         node_def=dbt_op,
         can_subset=True,
         asset_deps=asset_deps,
@@ -328,20 +345,19 @@ def load_assets_from_dbt_manifest(
     check.dict_param(manifest_json, "manifest_json", key_type=str)
     dbt_nodes = {**manifest_json["nodes"], **manifest_json["sources"]}
 
-    def _unique_id_to_selector(uid):
-        # take the fully-qualified node name and use it to select the model
-        return ".".join(dbt_nodes[uid]["fqn"])
+    if not selected_unique_ids:
+        select = "*"
+        # sources are never models, so only the nodes section needs scanning
+        selected_unique_ids = set(
+            unique_id
+            for unique_id, node_info in manifest_json["nodes"].items()
+            if node_info["resource_type"] == "model"
+        )
+    else:
+        # take the fully-qualified node name and use it to select the model, in a fixed order so
+        # that the op name derived from the selection is the same in every process
+        select = " ".join(".".join(dbt_nodes[uid]["fqn"]) for uid in sorted(selected_unique_ids))
 
-    select = (
-        "*"
-        if selected_unique_ids is None
-        else " ".join(_unique_id_to_selector(uid) for uid in selected_unique_ids)
-    )
-    selected_unique_ids = selected_unique_ids or set(
-        unique_id
-        for unique_id, node_info in dbt_nodes.items()
-        if node_info["resource_type"] == "model"
-    )
     return [
         _dbt_nodes_to_assets(
             dbt_nodes,
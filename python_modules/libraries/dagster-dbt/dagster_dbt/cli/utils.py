@@ -14,6 +14,26 @@
 from .constants import DBT_RUN_RESULTS_COMMANDS, DEFAULT_DBT_TARGET_PATH
 from .types import DbtCliOutput
 
+try:
+    # orjson is an optional, much faster parser for large dbt artifacts
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_loads(data: bytes) -> Any:
+    """Parses a dbt JSON artifact, using orjson when it is installed.
+
+    orjson is stricter than the stdlib parser (it rejects NaN/Infinity and integers wider than 64
+    bits), so anything it refuses is handed to ``json.loads`` instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)  # pylint: disable=no-member
+        except orjson.JSONDecodeError:  # pylint: disable=no-member
+            pass
+    return json.loads(data)
+
 
 def execute_cli(
     executable: str,
@@ -120,8 +140,8 @@ def parse_run_results(path: str, target_path: str = DEFAULT_DBT_TARGET_PATH) ->
     """Parses the `target/run_results.json` artifact that is produced by a dbt process."""
     run_results_path = os.path.join(path, target_path, "run_results.json")
     try:
-        with open(run_results_path, encoding="utf8") as file:
-            return json.load(file)
+        with open(run_results_path, "rb") as file:
+            return json_loads(file.read())
     except FileNotFoundError:
         raise DagsterDbtCliOutputsNotFoundError(path=run_results_path)
 
@@ -130,7 +150,7 @@ def parse_manifest(path: str, target_path: str = DEFAULT_DBT_TARGET_PATH) -> Dic
     """Parses the `target/manifest.json` artifact that is produced by a dbt process."""
     manifest_path = os.path.join(path, target_path, "manifest.json")
     try:
-        with open(manifest_path, encoding="utf8") as file:
-            return json.load(file)
+        with open(manifest_path, "rb") as file:
+            return json_loads(file.read())
     except FileNotFoundError:
         raise DagsterDbtCliOutputsNotFoundError(path=manifest_path)
@@ -37,6 +37,38 @@ def test_load_from_manifest_json():
     assert assets_job.execute_in_process().success
 
 
+def test_load_from_manifest_json_selection():
+    manifest_path = file_relative_path(__file__, "sample_manifest.json")
+    with open(manifest_path, "r", encoding="utf8") as f:
+        manifest_json = json.load(f)
+
+    # an empty selection is the same as no selection
+    all_assets = load_assets_from_dbt_manifest(manifest_json=manifest_json)
+    empty_selection_assets = load_assets_from_dbt_manifest(
+        manifest_json=manifest_json, selected_unique_ids=set()
+    )
+    assert empty_selection_assets[0].op.name == all_assets[0].op.name
+    assert set(empty_selection_assets[0].op.outs.keys()) == set(all_assets[0].op.outs.keys())
+
+    # the op name derived from a selection does not depend on the order of the selected ids
+    # (dict key views are ordered sets)
+    unique_ids = [
+        "model.dagster_dbt_test_project.sort_by_calories",
+        "model.dagster_dbt_test_project.least_caloric",
+        "model.dagster_dbt_test_project.sort_hot_cereals_by_calories",
+    ]
+    forward_assets = load_assets_from_dbt_manifest(
+        manifest_json=manifest_json, selected_unique_ids=dict.fromkeys(unique_ids).keys()
+    )
+    reversed_assets = load_assets_from_dbt_manifest(
+        manifest_json=manifest_json,
+        selected_unique_ids=dict.fromkeys(reversed(unique_ids)).keys(),
+    )
+    assert forward_assets[0].op.name != all_assets[0].op.name
+    assert forward_assets[0].op.name == reversed_assets[0].op.name
+    assert list(forward_assets[0].op.outs.keys()) == list(reversed_assets[0].op.outs.keys())
+
+
 def test_runtime_metadata_fn():
     manifest_path = file_relative_path(__file__, "sample_manifest.json")
     with open(manifest_path, "r", encoding="utf8") as f:
@@ -1,4 +1,7 @@
+import os
+
 import pytest
+from dagster_dbt.cli.utils import parse_run_results
 from dagster_dbt.types import DbtOutput
 from dagster_dbt.utils import generate_materializations
 
@@ -23,3 +26,14 @@ def test_generate_materializations(sample):
     mat_names = {mat.asset_key for mat in materializations}
 
     assert mat_names == {AssetKey(["model", "my_schema", f"table_{i}"]) for i in range(1, 4)}
+
+
+def test_parse_run_results_non_strict_json(tmp_path):
+    # values that strict parsers such as orjson reject must still load
+    os.makedirs(tmp_path / "target")
+    with open(tmp_path / "target" / "run_results.json", "w") as f:
+        f.write('{"results": [{"execution_time": NaN, "rows_affected": 18446744073709551616}]}')
+
+    (result,) = parse_run_results(str(tmp_path))["results"]
+    assert result["execution_time"] != result["execution_time"]
+    assert result["rows_affected"] == 2**64